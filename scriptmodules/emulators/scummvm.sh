@@ -82,7 +82,10 @@ game="\$1"
 pushd "$romdir/scummvm" >/dev/null
 $md_inst/bin/scummvm --fullscreen --joystick=0 --extrapath="$md_inst/extra" \$game
 while read id desc; do
-    echo "\$desc" > "$romdir/scummvm/\$id.svm"
+    svm="$romdir/scummvm/\$id.svm"
+    # skip rewriting svm files whose description is unchanged
+    [[ -f "\$svm" ]] && read -r cur < "\$svm" && [[ "\$cur" == "\$desc" ]] && continue
+    echo "\$desc" > "\$svm"
 done < <($md_inst/bin/scummvm --list-targets | tail -n +3)
 popd >/dev/null
 _EOF_